@@ -0,0 +1,154 @@
+"""Behaviour checks for the pure helpers in word_file_genreator"""
+import asyncio
+import io
+import json
+import random
+import types
+
+import pytest
+from docx import Document
+from streamlit.runtime.scriptrunner import StopException
+
+import word_file_genreator as w
+
+
+def test_run_async_cancels_siblings_of_a_stopped_task(monkeypatch):
+    monkeypatch.setattr(w.st, 'session_state', {})  # persists across calls like a real session
+    finished = []
+    
+    async def section(index):
+        await asyncio.sleep(0.05)
+        finished.append(index)
+    
+    async def stopped():
+        raise StopException()
+    
+    async def generate():
+        await asyncio.gather(section(1), section(2), stopped())
+    
+    with pytest.raises(StopException):
+        w.run_async(generate())
+    w.run_async(asyncio.sleep(0.1))
+    
+    assert finished == []
+    assert not asyncio.all_tasks(w.st.session_state['event_loop'])
+
+
+def test_iter_sections_orders_custom_sections_numerically():
+    keys = [f"section_{i}" for i in range(1, 13)]
+    shuffled = keys[:]
+    random.Random(0).shuffle(shuffled)
+    sections = {key: {'title': key} for key in shuffled}
+    
+    assert [key for key, _ in w._iter_sections(sections)] == keys
+
+
+def test_iter_sections_yields_present_default_sections_in_order():
+    sections = {key: {'title': key} for key in ('references', 'methodology', 'introduction')}
+    
+    assert [key for key, _ in w._iter_sections(sections)] == ['introduction', 'methodology', 'references']
+
+
+def test_iter_sections_prefers_custom_sections_over_defaults():
+    sections = {'introduction': {}, 'section_2': {}, 'section_1': {}}
+    
+    assert [key for key, _ in w._iter_sections(sections)] == ['section_1', 'section_2']
+
+
+def test_document_numbers_eleven_custom_sections_in_order():
+    sections = {f"section_{i}": {'title': f"Part {i}", 'content': "Body.", 'images': []}
+                for i in range(11, 0, -1)}
+    doc = Document(io.BytesIO(w._base_document_bytes()))
+    leader = doc.add_paragraph()
+    
+    for counter, (_, section_data) in enumerate(w._iter_sections(sections), start=1):
+        w.add_section_content_safe(leader, section_data, counter)
+    
+    headings = [p.text for p in doc.paragraphs if p.runs and p.runs[0].style.name == 'TNR14Bold']
+    assert headings == [f"{i}. Part {i}" for i in range(1, 12)]
+
+
+class FakeCompletions:
+    """Stands in for AsyncGroq's chat.completions, answering JSON-mode requests with json_reply"""
+    
+    def __init__(self, json_reply):
+        self.json_reply = json_reply
+        self.plain_prompts = []
+    
+    async def create(self, messages, **kwargs):
+        if kwargs.get('response_format'):
+            content = self.json_reply
+        else:
+            self.plain_prompts.append(messages[-1]['content'])
+            content = "Fallback text."
+        message = types.SimpleNamespace(content=content)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+def fake_client(json_reply):
+    return types.SimpleNamespace(chat=types.SimpleNamespace(completions=FakeCompletions(json_reply)))
+
+
+def section_spec(section_key):
+    return (section_key, section_key.title(), f"Write about {section_key}.", [], False, 400)
+
+
+@pytest.fixture(autouse=True)
+def empty_content_cache():
+    w._content_cache.clear()
+    yield
+    w._content_cache.clear()
+
+
+def test_batched_sections_keep_only_string_values():
+    reply = json.dumps({'intro': "  Intro text.  ", 'body': 42, 'outro': "   "})
+    specs = [section_spec(key) for key in ('intro', 'body', 'outro', 'missing')]
+    
+    sections = w.run_async(w.generate_sections_batched(fake_client(reply), "Context", specs))
+    
+    assert sections == {'intro': "Intro text."}
+
+
+@pytest.mark.parametrize('reply', ["not json", json.dumps(["intro"]), '{"intro": "cut off'])
+def test_batched_sections_empty_on_unusable_reply(reply):
+    specs = [section_spec('intro')]
+    
+    assert w.run_async(w.generate_sections_batched(fake_client(reply), "Context", specs)) == {}
+
+
+def test_project_sections_fall_back_only_for_missing_sections():
+    client = fake_client(json.dumps({'section_1': "Batched one.", 'section_2': None}))
+    
+    sections = w.run_async(w.generate_project_sections(client, "Title", "Description", "One\nTwo",
+                                                       10, [], ""))
+    
+    assert sections['section_1']['content'] == "Batched one."
+    assert sections['section_2']['content'] == "Fallback text."
+    assert len(client.chat.completions.plain_prompts) == 1
+    assert '"Two"' in client.chat.completions.plain_prompts[0]
+
+
+def legacy_strip_list_prefix(line):
+    """The lstrip chain format_content_with_lists used before _BULLET_PREFIX_RE"""
+    return line.lstrip('•-*').lstrip('0123456789.').strip()
+
+
+@pytest.mark.parametrize('line, expected', [
+    ("- 3D printing", "• 3D printing"),
+    ("* 2024 results", "• 2024 results"),
+    ("• Step one", "• Step one"),
+    ("1. Collect data", "• Collect data"),
+    ("12.3 Analyse results", "• Analyse results"),
+    ("--* 4. Spaced number", "• 4. Spaced number"),
+    ("Plain paragraph text.", "Plain paragraph text."),
+])
+def test_format_content_with_lists_strips_only_the_prefix(line, expected):
+    assert w.format_content_with_lists(line) == expected
+
+
+def test_bullet_prefix_regex_matches_legacy_lstrip_chain():
+    rng = random.Random(17)
+    alphabet = "•-* 0123456789.aD\t"
+    for _ in range(20000):
+        line = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))).strip()
+        assert w._BULLET_PREFIX_RE.sub('', line, count=1) == legacy_strip_list_prefix(line), repr(line)
@@ -1,26 +1,122 @@
 import streamlit as st
+import asyncio
+import hashlib
 import io
+import json
 import os
-import time
 import re
-import requests
-from datetime import datetime
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
-from docx.enum.style import WD_STYLE_TYPE
-from docx.enum.section import WD_SECTION
-from docx.oxml.shared import OxmlElement, qn
-from groq import Groq
-import PyPDF2
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
 from urllib.parse import quote_plus
-from PIL import Image
-import tempfile
-import random
+from xml.sax.saxutils import escape
+
+# Heavy third-party modules (httpx, docx, groq, pypdfium2, PIL) are imported inside
+# the functions that use them, so UI-only reruns don't pay their import cost.
+
+
+# Precompiled patterns for the text-cleaning paths
+_CLEAN_RE = re.compile(r'[^\w\.\,\;\:\!\?\-\(\)]+')  # disallowed chars and whitespace runs
+_NON_ALNUM_RE = re.compile(r'[^\w\s-]')
+_LEAD_NUM_RE = re.compile(r'^\d+\.?\s*')
+_NUM_DOT_RE = re.compile(r'^\d+\.')
+_BULLET_PREFIX_RE = re.compile(r'^[•\-*]*[0-9.]*\s*')  # leading bullet marker and/or list number
+
+_LIST_KEYWORDS = ('step ', 'objective ', 'method ', 'approach ')
+
+# Token budgeting for the batched section request (gemma2-9b-it has an 8k context window)
+_MODEL_CONTEXT_TOKENS = 8192
+_TOKENS_PER_WORD = 1.4          # English prose, with headroom for JSON string escapes
+_JSON_TOKENS_PER_SECTION = 20   # key, quotes and separators around each section
+_CHARS_PER_PROMPT_TOKEN = 3     # conservative estimate for sizing the prompt
+_SYSTEM_PROMPT_TOKENS = 60
+
+# Deletes every ASCII character not allowed in download file names
+_FILENAME_DROP_TABLE = str.maketrans('', '', ''.join(
+    chr(code) for code in range(128) if not (chr(code).isalnum() or chr(code) in ' -_')
+))
+
+# Default academic sections in document order, with their document headings
+DEFAULT_SECTION_ORDER = (
+    ('introduction', 'INTRODUCTION'),
+    ('literature_review', 'LITERATURE REVIEW'),
+    ('methodology', 'METHODOLOGY'),
+    ('results', 'RESULTS AND ANALYSIS'),
+    ('conclusion', 'CONCLUSION'),
+    ('references', 'REFERENCES'),
+)
+_DEFAULT_DISPLAY_TITLES = dict(DEFAULT_SECTION_ORDER)
+
+# Default section titles shown in the content preview
+SECTION_TITLES = {
+    'introduction': 'Introduction',
+    'literature_review': 'Literature Review',
+    'methodology': 'Methodology',
+    'results': 'Results and Analysis',
+    'conclusion': 'Conclusion',
+    'references': 'References',
+}
+
+
+def run_async(coro):
+    """Run a coroutine on this session's event loop and cancel any tasks it leaves pending"""
+    # Kept in session state: async API clients' connection pools are bound to the
+    # loop that first used them
+    loop = st.session_state.get('event_loop')
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        st.session_state['event_loop'] = loop
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        # A stopped or rerun script raises out of one gathered task without cancelling
+        # its siblings; drain them here so they don't resume during the next run
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+
+def get_http_client():
+    """Return this session's pooled async HTTP client for image search and downloads"""
+    import httpx
+    client = st.session_state.get('http_client')
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            http2=True,
+            timeout=15
+        )
+        st.session_state['http_client'] = client
+    return client
+
+
+def get_groq_client(api_key):
+    """Return this session's Groq client, reusing its connection pool across reruns"""
+    cached = st.session_state.get('groq_client')
+    if cached is None or cached[0] != api_key:
+        from groq import AsyncGroq
+        cached = (api_key, AsyncGroq(api_key=api_key))
+        st.session_state['groq_client'] = cached
+    return cached[1]
+
+
+def get_rate_limiter(name, max_rate, time_period):
+    """Return this session's token-bucket limiter for an API, created on first use"""
+    from aiolimiter import AsyncLimiter
+    limiter = st.session_state.get(f'{name}_limiter')
+    if limiter is None:
+        limiter = AsyncLimiter(max_rate, time_period)
+        st.session_state[f'{name}_limiter'] = limiter
+    return limiter
 
 
 def set_font_style(paragraph, font_name="Times New Roman", font_size=12, bold=False):
     """Set font style for a paragraph"""
+    from docx.shared import Pt
     try:
         for run in paragraph.runs:
             font = run.font
@@ -33,6 +129,8 @@ def set_font_style(paragraph, font_name="Times New Roman", font_size=12, bold=Fa
 
 def create_heading_style(doc, style_name, font_size, bold=True, space_after=12):
     """Create a custom heading style with error handling"""
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.shared import Pt
     try:
         styles = doc.styles
         if style_name not in styles:
@@ -48,8 +146,75 @@ def create_heading_style(doc, style_name, font_size, bold=True, space_after=12):
         return doc.styles['Normal']
 
 
+# Character styles shared by runs: name -> (size in points, bold, italic)
+_RUN_STYLES = {
+    'TNR10': (10, False, False),
+    'TNR10Bold': (10, True, False),
+    'TNRItalic10': (10, False, True),
+    'TNR12': (12, False, False),
+    'TNR14Bold': (14, True, False),
+    'TNR16Bold': (16, True, False),
+}
+
+
+def create_run_styles(doc):
+    """Add the Times New Roman character styles in _RUN_STYLES to a document"""
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.shared import Pt
+    styles = doc.styles
+    for style_name, (font_size, bold, italic) in _RUN_STYLES.items():
+        try:
+            if style_name not in styles:
+                style = styles.add_style(style_name, WD_STYLE_TYPE.CHARACTER)
+                style.font.name = 'Times New Roman'
+                style.font.size = Pt(font_size)
+                style.font.bold = bold
+                style.font.italic = italic
+        except:
+            pass
+
+
+# Single-run paragraph XML; only the formatting values and text are substituted per call
+_PARA_TEMPLATE = (
+    '<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:pPr>{spacing}<w:jc w:val="{align}"/></w:pPr>'
+    '<w:r><w:rPr><w:rFonts w:ascii="{font}" w:hAnsi="{font}"/>{bold}{italic}<w:sz w:val="{half_points}"/></w:rPr>'
+    '{text}</w:r></w:p>'
+)
+_JC_VALUES = {'left': 'left', 'center': 'center', 'right': 'right', 'justify': 'both'}
+
+
+def styled_para(leader, text, *, size, bold=False, italic=False, align='center',
+                font='Times New Roman', space_after=None):
+    """Insert a single-run formatted paragraph before the leader paragraph"""
+    from docx.oxml import parse_xml
+    from docx.text.paragraph import Paragraph
+    
+    text_xml = '<w:br/>'.join(  # line breaks become <w:br/>, as with Paragraph.add_run()
+        f'<w:t xml:space="preserve">{escape(line)}</w:t>' for line in text.split('\n')
+    )
+    p = parse_xml(_PARA_TEMPLATE.format(
+        spacing=f'<w:spacing w:after="{int(space_after * 20)}"/>' if space_after is not None else '',
+        align=_JC_VALUES[align],
+        font=escape(font, {'"': '&quot;'}),
+        bold='<w:b/>' if bold else '',
+        italic='<w:i/>' if italic else '',
+        half_points=int(size * 2),
+        text=text_xml,
+    ))
+    leader._p.addprevious(p)
+    return Paragraph(p, leader._parent)
+
+
+@lru_cache(maxsize=1)
+def _today_str(ordinal):
+    """Format the date with the given ordinal for the cover page; cached until the date changes"""
+    return date.fromordinal(ordinal).strftime("%B %d, %Y")
+
+
 def add_header_footer_safe(doc, project_title, student_name):
     """Add header and footer with error handling"""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
     try:
         section = doc.sections[0]
         
@@ -60,25 +225,69 @@ def add_header_footer_safe(doc, project_title, student_name):
             header_para.text = project_title.upper()[:50]  # Limit length
             header_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
             if header_para.runs:
-                header_para.runs[0].font.name = 'Times New Roman'
-                header_para.runs[0].font.size = Pt(10)
-                header_para.runs[0].font.bold = True
+                header_para.runs[0].style = 'TNR10Bold'
         
         # Footer - simplified without XML manipulation
         footer = section.footer
         if footer.paragraphs:
             footer_para = footer.paragraphs[0]
             footer_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            footer_run = footer_para.add_run(f"{student_name[:30]} | Page #")
-            footer_run.font.name = 'Times New Roman'
-            footer_run.font.size = Pt(10)
+            footer_para.add_run(f"{student_name[:30]} | Page #", 'TNR10')
             
     except Exception as e:
         st.warning(f"Header/footer setup failed: {str(e)}")
 
 
-def search_google_images(query, api_key, cse_id, num_results=3):
+@st.cache_resource
+def get_image_executor():
+    """Return the shared thread pool used for Pillow decode/resize work"""
+    return ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+# Process-wide caches of successful API results, shared across reruns.
+# Entries are (stored_at, value) and expire after _CACHE_TTL_SECONDS.
+_CACHE_TTL_SECONDS = 3600
+_CACHE_MAX_ENTRIES = 512
+_cache_lock = threading.Lock()
+_cse_cache = {}      # (cleaned query, CSE ID, result count) -> image results
+_content_cache = {}  # prompt hash -> generated text
+_image_cache = {}    # image URL -> processed JPEG bytes
+
+
+def cache_lookup(cache, key):
+    """Return a fresh cached value, or None if missing or expired"""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    stored_at, value = entry
+    if time.monotonic() - stored_at > _CACHE_TTL_SECONDS:
+        cache.pop(key, None)
+        return None
+    return value
+
+
+def cache_store(cache, key, value):
+    """Store a value, evicting the oldest entry when the cache is full"""
+    with _cache_lock:
+        if key not in cache and len(cache) >= _CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)), None)
+        cache[key] = (time.monotonic(), value)
+
+
+def prompt_cache_key(*parts):
+    """Hash prompt text into a compact cache key"""
+    return hashlib.sha256("\x00".join(parts).encode('utf-8')).hexdigest()
+
+
+def image_search_cache_key(query, cse_id, num_results=3):
+    """Build the cache key for an image search, cleaning the query the same way the request does"""
+    cleaned_query = _NON_ALNUM_RE.sub('', query.strip())[:100]
+    return (cleaned_query, cse_id.strip(), min(num_results, 10))
+
+
+async def search_google_images(query, api_key, cse_id, num_results=3):
     """Search for images using Google Custom Search API with improved error handling"""
+    import httpx
     try:
         # Validate inputs
         if not api_key or not cse_id:
@@ -87,11 +296,13 @@ def search_google_images(query, api_key, cse_id, num_results=3):
         if not query or len(query.strip()) == 0:
             return []
         
-        # Clean and prepare the query
-        cleaned_query = query.strip()
-        cleaned_query = re.sub(r'[^\w\s-]', '', cleaned_query)
-        if len(cleaned_query) > 100:
-            cleaned_query = cleaned_query[:100]
+        # Reuse earlier results for the same query to save quota and latency
+        cache_key = image_search_cache_key(query, cse_id, num_results)
+        cached_results = cache_lookup(_cse_cache, cache_key)
+        if cached_results is not None:
+            return list(cached_results)
+        
+        cleaned_query = cache_key[0]
         
         search_url = "https://www.googleapis.com/customsearch/v1"
         params = {
@@ -106,10 +317,9 @@ def search_google_images(query, api_key, cse_id, num_results=3):
             'fileType': 'jpg,png,jpeg'
         }
         
-        # Add small delay between requests to avoid rate limiting
-        time.sleep(0.8)
-        
-        response = requests.get(search_url, params=params, timeout=15)
+        client = get_http_client()
+        async with get_rate_limiter('cse', 10, 1):
+            response = await client.get(search_url, params=params)
         
         if response.status_code == 400:
             error_detail = response.text
@@ -128,9 +338,10 @@ def search_google_images(query, api_key, cse_id, num_results=3):
         elif response.status_code == 429:
             st.warning("Too many requests. Please wait before trying again.")
             # Wait and retry once
-            time.sleep(3)
+            await asyncio.sleep(3)
             try:
-                response = requests.get(search_url, params=params, timeout=15)
+                async with get_rate_limiter('cse', 10, 1):
+                    response = await client.get(search_url, params=params)
                 response.raise_for_status()
             except:
                 return []
@@ -149,9 +360,12 @@ def search_google_images(query, api_key, cse_id, num_results=3):
                         'title': item.get('title', 'Related Image')[:100]
                     })
         
-        return image_urls
+        # Only successful responses reach this point, so errors are never cached
+        cache_store(_cse_cache, cache_key, image_urls)
         
-    except requests.exceptions.Timeout:
+        return list(image_urls)
+        
+    except httpx.TimeoutException:
         st.warning(f"Image search timed out for '{query}' - continuing without images")
         return []
     except Exception as e:
@@ -159,173 +373,261 @@ def search_google_images(query, api_key, cse_id, num_results=3):
         return []
 
 
-def download_image_safe(image_url, timeout=15, max_size_mb=5):
-    """Download image with better error handling and size limits"""
+async def download_image_safe(image_url, timeout=15, max_size_mb=5):
+    """Download image with better error handling and size limits; returns JPEG bytes"""
     try:
+        # Reuse a previously processed copy of this image
+        cached_image = cache_lookup(_image_cache, image_url)
+        if cached_image is not None:
+            return cached_image
+        
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': 'gzip, deflate',
             'DNT': '1',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
         
-        # Add delay to avoid overwhelming servers
-        time.sleep(0.5)
-        
-        response = requests.get(image_url, headers=headers, timeout=timeout, stream=True)
-        response.raise_for_status()
-        
-        # Check content type
-        content_type = response.headers.get('content-type', '').lower()
-        if not any(img_type in content_type for img_type in ['image/jpeg', 'image/jpg', 'image/png']):
-            return None
-        
-        # Load with size checking
-        image_data = b''
-        downloaded_size = 0
-        max_size_bytes = max_size_mb * 1024 * 1024
-        
-        for chunk in response.iter_content(chunk_size=8192):
-            downloaded_size += len(chunk)
-            if downloaded_size > max_size_bytes:
+        client = get_http_client()
+        async with client.stream('GET', image_url, headers=headers, timeout=timeout,
+                                 follow_redirects=True) as response:
+            response.raise_for_status()
+            
+            # Check content type
+            content_type = response.headers.get('content-type', '').lower()
+            if not any(img_type in content_type for img_type in ['image/jpeg', 'image/jpg', 'image/png']):
+                return None
+            
+            # Reject oversized files before reading the body when the server reports a size
+            max_size_bytes = max_size_mb * 1024 * 1024
+            content_length = response.headers.get('content-length', '')
+            if content_length.isdigit() and int(content_length) > max_size_bytes:
                 return None
-            image_data += chunk
+            
+            # Load with size checking; write into a buffer to avoid re-copying on every chunk
+            image_data = io.BytesIO()
+            downloaded_size = 0
+            
+            async for chunk in response.aiter_bytes(65536):
+                downloaded_size += len(chunk)
+                if downloaded_size > max_size_bytes:
+                    return None
+                image_data.write(chunk)
         
         # Validate minimum size
-        if len(image_data) < 1024:  # Less than 1KB
+        if downloaded_size < 1024:  # Less than 1KB
             return None
         
-        # Load with PIL
-        image = Image.open(io.BytesIO(image_data))
-        
-        # Convert to RGB if necessary
-        if image.mode in ('RGBA', 'P'):
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'RGBA':
-                background.paste(image, mask=image.split()[-1])
-            else:
-                background.paste(image)
-            image = background
-        elif image.mode != 'RGB':
-            image = image.convert('RGB')
-        
-        # Resize if too large
-        max_dimension = 800
-        if max(image.size) > max_dimension:
-            ratio = max_dimension / max(image.size)
-            new_size = tuple(int(dim * ratio) for dim in image.size)
-            image = image.resize(new_size, Image.Resampling.LANCZOS)
+        # Decode and resize off the event loop so other downloads keep flowing
+        loop = asyncio.get_running_loop()
+        image_bytes = await loop.run_in_executor(get_image_executor(), process_downloaded_image, image_data)
         
-        # Validate minimum size
-        if min(image.size) < 100:
-            return None
-            
-        return image
+        if image_bytes:
+            cache_store(_image_cache, image_url, image_bytes)
+        return image_bytes
         
     except Exception as e:
         return None
 
 
-def add_image_to_document_safe(doc, image, caption="", width_inches=4.5):
-    """Add image to document with better error handling and unique filenames"""
+def process_downloaded_image(image_data):
+    """Decode, convert, resize and JPEG-encode a downloaded image (CPU-bound, runs in a worker thread)"""
+    from PIL import Image
+    max_dimension = 800
+    
+    # Load with PIL; for JPEGs, let the decoder downscale while decompressing
+    image_data.seek(0)
+    image = Image.open(image_data)
+    image.draft('RGB', (max_dimension, max_dimension))
+    image.load()
+    
+    # Convert to RGB if necessary; only composite onto white when there is real transparency
+    if image.mode == 'RGBA':
+        alpha_min = image.getextrema()[3][0]
+        if alpha_min == 255:
+            image = image.convert('RGB')
+        else:
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.split()[3])
+            image = background
+    elif image.mode != 'RGB':
+        image = image.convert('RGB')
+    
+    # Resize in place if too large; bilinear is indistinguishable at document size
+    image.thumbnail((max_dimension, max_dimension), Image.Resampling.BILINEAR)
+    
+    # Validate minimum size
+    if min(image.size) < 100:
+        return None
+    
+    # Encode once here so the result is plain bytes, cheap to cache and embed
+    jpeg_data = io.BytesIO()
+    image.save(jpeg_data, 'JPEG', quality=85, optimize=False, progressive=False)
+    return jpeg_data.getvalue()
+
+
+def add_image_to_document_safe(leader, image_data, caption="", width_inches=4.5):
+    """Add JPEG image bytes before the leader paragraph with better error handling"""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Inches, Pt
     try:
-        if not image:
+        if not image_data:
             return False
         
-        # Ensure image is in RGB format
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
-        
-        # Create unique temporary file with timestamp and random suffix
-        temp_dir = tempfile.gettempdir()
-        timestamp = int(time.time() * 1000)
-        random_suffix = random.randint(1000, 9999)
-        temp_filename = f"temp_img_{timestamp}_{random_suffix}.jpg"
-        temp_path = os.path.join(temp_dir, temp_filename)
+        # Add image to document
+        img_paragraph = leader.insert_paragraph_before()
+        img_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        
+        run = img_paragraph.add_run()
+        
+        # Validate width
+        if width_inches > 6.0:
+            width_inches = 6.0
+        elif width_inches < 2.0:
+            width_inches = 2.0
+        
+        run.add_picture(io.BytesIO(image_data), width=Inches(width_inches))
+        
+        # Add caption if provided
+        if caption and caption.strip():
+            caption_para = leader.insert_paragraph_before()
+            caption_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            caption_text = caption.strip()
+            if len(caption_text) > 100:
+                caption_text = caption_text[:97] + "..."
+            caption_para.add_run(f"Figure: {caption_text}", 'TNRItalic10')
+            caption_para.paragraph_format.space_after = Pt(12)
+        else:
+            img_paragraph.paragraph_format.space_after = Pt(12)
         
-        try:
-            # Save image with high quality
-            image.save(temp_path, 'JPEG', quality=95, optimize=True)
-            
-            if not os.path.exists(temp_path) or os.path.getsize(temp_path) == 0:
-                return False
-            
-            # Add image to document
-            img_paragraph = doc.add_paragraph()
-            img_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            run = img_paragraph.add_run()
-            
-            # Validate width
-            if width_inches > 6.0:
-                width_inches = 6.0
-            elif width_inches < 2.0:
-                width_inches = 2.0
-            
-            run.add_picture(temp_path, width=Inches(width_inches))
-            
-            # Add caption if provided
-            if caption and caption.strip():
-                caption_para = doc.add_paragraph()
-                caption_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                caption_text = caption.strip()
-                if len(caption_text) > 100:
-                    caption_text = caption_text[:97] + "..."
-                caption_run = caption_para.add_run(f"Figure: {caption_text}")
-                caption_run.font.name = 'Times New Roman'
-                caption_run.font.size = Pt(10)
-                caption_run.font.italic = True
-            
-            return True
-            
-        finally:
-            # Clean up temp file with retry
-            for attempt in range(3):
-                try:
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
-                    break
-                except:
-                    time.sleep(0.1)
-                    continue
+        return True
                 
     except Exception as e:
         return False
 
 
+# Guards every PDFium call; the library must not be used from two threads at once
+_PDFIUM_LOCK = threading.Lock()
+
+
 def extract_pdf_text(pdf_file):
     """Extract text from uploaded PDF file with error filtering"""
+    import pypdfium2 as pdfium
     try:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            page_text = page.extract_text()
-            if page_text and len(page_text.strip()) > 50:
-                text += page_text + "\n"
-        
-        # Clean up the text
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s\.\,\;\:\!\?\-\(\)]', '', text)
-        
-        return text[:3000] if text else "No readable content found"
+        pages_text = []
+        collected = 0
+        
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(pdf_file.getvalue())
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    page_text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                    
+                    if len(page_text.strip()) > 50:
+                        pages_text.append(page_text)
+                        collected += len(page_text)
+                    
+                    # Only the start of the text is used, so stop once there is enough
+                    if collected >= 6000:
+                        break
+            finally:
+                pdf.close()
+        
+        text = "\n".join(pages_text)
+        
+        # Clean up the text; only 3000 characters are kept, so clean a bounded prefix
+        text = _CLEAN_RE.sub(' ', text[:6000])[:3000]
+        
+        return text if text else "No readable content found"
     except Exception as e:
         return f"Error processing {pdf_file.name}: Unable to extract readable content"
 
 
-def generate_content_with_groq(client, prompt, max_retries=3):
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_pdf_text(file_name, file_size, file_sha1, _pdf_file):
+    """Extract PDF text once per distinct upload, keyed by name, size and content hash"""
+    return extract_pdf_text(_pdf_file)
+
+
+async def generate_content_with_groq(client, prompt, max_retries=3):
     """Generate content using Groq API with retry mechanism"""
+    # Identical prompts (e.g. after a Streamlit rerun) reuse earlier output
+    cache_key = prompt_cache_key(prompt)
+    cached_content = cache_lookup(_content_cache, cache_key)
+    if cached_content is not None:
+        return cached_content
+    
     for attempt in range(max_retries):
         try:
-            chat_completion = client.chat.completions.create(
+            async with get_rate_limiter('groq', 30, 60):
+                chat_completion = await client.chat.completions.create(
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": """You are an expert academic writer. Generate high-quality, well-structured academic content. 
+                            Use proper academic language and formatting. When creating lists or steps, use bullet points or numbered lists.
+                            Structure content with clear paragraphs and logical flow."""
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    model="gemma2-9b-it",
+                    max_tokens=2000,
+                    temperature=0.7,
+                )
+            content = chat_completion.choices[0].message.content
+            cache_store(_content_cache, cache_key, content)
+            return content
+        except Exception as e:
+            if attempt < max_retries - 1:
+                await asyncio.sleep(2)
+                continue
+            else:
+                return f"Error generating content: {str(e)}"
+
+
+async def generate_sections_batched(client, context, section_specs):
+    """Generate all sections in one JSON-mode request, returning only the usable ones"""
+    section_briefs = "\n".join(
+        f'Key "{section_key}" - {section_title}:\n{instructions.strip()}\n'
+        for section_key, section_title, instructions, _, _, _ in section_specs
+    )
+    prompt = f"""
+{context}
+
+Write every section of this project listed below. Respond with a single JSON object whose keys are
+exactly the section keys given and whose values are the full section text as plain strings.
+Use line breaks, bullet points and numbered lists inside the strings where appropriate.
+
+{section_briefs}
+"""
+    # Size the output from the sections' word targets; skip the request when it can't
+    # fit the context window, since a truncated JSON reply would not parse anyway
+    max_tokens = sum(int(max_words * _TOKENS_PER_WORD) + _JSON_TOKENS_PER_SECTION
+                     for *_, max_words in section_specs)
+    if len(prompt) // _CHARS_PER_PROMPT_TOKEN + _SYSTEM_PROMPT_TOKENS + max_tokens > _MODEL_CONTEXT_TOKENS:
+        return {}
+    
+    cache_key = prompt_cache_key("json", prompt, str(max_tokens))
+    cached_sections = cache_lookup(_content_cache, cache_key)
+    if cached_sections is not None:
+        return dict(cached_sections)
+    
+    try:
+        async with get_rate_limiter('groq', 30, 60):
+            chat_completion = await client.chat.completions.create(
                 messages=[
                     {
                         "role": "system",
                         "content": """You are an expert academic writer. Generate high-quality, well-structured academic content. 
-                        Use proper academic language and formatting. When creating lists or steps, use bullet points or numbered lists.
-                        Structure content with clear paragraphs and logical flow."""
+                        Use proper academic language and formatting. Always respond with a valid JSON object."""
                     },
                     {
                         "role": "user",
@@ -333,19 +635,28 @@ def generate_content_with_groq(client, prompt, max_retries=3):
                     }
                 ],
                 model="gemma2-9b-it",
-                max_tokens=2000,
+                max_tokens=max_tokens,
                 temperature=0.7,
+                response_format={"type": "json_object"},
             )
-            return chat_completion.choices[0].message.content
-        except Exception as e:
-            if attempt < max_retries - 1:
-                time.sleep(2)
-                continue
-            else:
-                return f"Error generating content: {str(e)}"
+        generated = json.loads(chat_completion.choices[0].message.content)
+    except Exception:
+        return {}
+    
+    if not isinstance(generated, dict):
+        return {}
+    
+    sections = {
+        section_key: generated[section_key].strip()
+        for section_key, *_ in section_specs
+        if isinstance(generated.get(section_key), str) and generated[section_key].strip()
+    }
+    if sections:
+        cache_store(_content_cache, cache_key, sections)
+    return dict(sections)
 
 
-def generate_formal_abstract(client, title, description, num_pages):
+async def generate_formal_abstract(client, title, description, num_pages):
     """Generate a formal academic abstract"""
     prompt = f"""
 Write a formal academic abstract (150-200 words) for a project titled "{title}".
@@ -360,24 +671,28 @@ The abstract should include:
 
 Use formal academic language and structure. Make it concise but comprehensive.
 """
-    return generate_content_with_groq(client, prompt)
+    return await generate_content_with_groq(client, prompt)
+
+
+def is_list_item(line):
+    """Check whether a stripped line should be rendered as a bullet point"""
+    return (line.startswith(('•', '-', '*')) or
+            _NUM_DOT_RE.match(line) is not None or
+            (any(keyword in line.lower() for keyword in _LIST_KEYWORDS) and len(line) < 100))
 
 
 def format_content_with_lists(content):
     """Format content to include proper bullet points and numbered lists"""
-    lines = content.split('\n')
     formatted_lines = []
     
-    for line in lines:
+    for line in content.split('\n'):
         line = line.strip()
-        if line:
-            if (line.lower().startswith(('•', '-', '*')) or 
-                re.match(r'^\d+\.', line) or
-                any(keyword in line.lower() for keyword in ['step ', 'objective ', 'method ', 'approach ']) and
-                len(line) < 100):
-                formatted_lines.append(f"• {line.lstrip('•-*').lstrip('0123456789.').strip()}")
-            else:
-                formatted_lines.append(line)
+        if not line:
+            continue
+        if is_list_item(line):
+            formatted_lines.append(f"• {_BULLET_PREFIX_RE.sub('', line, count=1)}")
+        else:
+            formatted_lines.append(line)
     
     return '\n'.join(formatted_lines)
 
@@ -387,19 +702,10 @@ def parse_toc_items(toc_items):
     if not toc_items or not toc_items.strip():
         return None
     
-    toc_list = []
-    lines = toc_items.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if line:
-            clean_line = re.sub(r'^\d+\.?\s*', '', line)
-            toc_list.append(clean_line)
-    
-    return toc_list
+    return [_LEAD_NUM_RE.sub('', line) for line in map(str.strip, toc_items.split('\n')) if line]
 
 
-def generate_project_sections(client, title, description, toc_items, num_pages, 
+async def generate_project_sections(client, title, description, toc_items, num_pages, 
                             pdf_texts, additional_notes, google_api_key=None, cse_id=None):
     """Generate all project sections using Groq with improved image integration"""
     sections = {}
@@ -426,6 +732,10 @@ Additional Context: {additional_notes if additional_notes else 'None provided'}
     image_search_count = 0
     max_image_searches = 12  # Reasonable limit
     
+    # (section_key, section_title, section instructions, image search queries, is_references,
+    #  upper word target used to size the batched request)
+    section_specs = []
+    
     if parsed_toc:
         st.info(f"Generating content for {len(parsed_toc)} custom sections...")
         
@@ -433,8 +743,6 @@ Additional Context: {additional_notes if additional_notes else 'None provided'}
             section_key = f"section_{i+1}"
             
             section_prompt = f"""
-{full_context}
-
 Write a comprehensive academic section titled "{section_title}" (400-600 words) for this project.
 Structure the content with:
 - Clear introduction to the section topic
@@ -445,60 +753,23 @@ Structure the content with:
 Make it relevant to the project topic and ensure logical flow.
 """
             
-            with st.spinner(f"Generating '{section_title}'..."):
-                content = generate_content_with_groq(client, section_prompt)
-                formatted_content = format_content_with_lists(content)
-                
-                # Search for relevant images with quota management
-                images = []
-                if (google_api_key and cse_id and 
-                    image_search_count < max_image_searches and
-                    section_title.lower() not in ['references', 'bibliography']):
-                    
-                    # Create more specific search query
-                    search_terms = [
-                        f"{title} {section_title}",
-                        f"{section_title} research methodology",
-                        f"{title.split()[0]} {section_title}"
-                    ]
-                    
-                    for search_term in search_terms[:2]:  # Try 2 different queries
-                        if image_search_count >= max_image_searches:
-                            break
-                            
-                        image_results = search_google_images(search_term, google_api_key, cse_id, 3)
-                        image_search_count += 1
-                        
-                        successful_downloads = 0
-                        for img_data in image_results:
-                            if successful_downloads >= 2:  # Limit per section
-                                break
-                                
-                            img = download_image_safe(img_data['url'])
-                            if img:
-                                images.append({
-                                    'image': img,
-                                    'caption': img_data['title'][:80] + "..." if len(img_data['title']) > 80 else img_data['title']
-                                })
-                                successful_downloads += 1
-                        
-                        if successful_downloads > 0:
-                            break  # Got images, no need to try more queries
-                
-                sections[section_key] = {
-                    'title': section_title,
-                    'content': formatted_content,
-                    'images': images
-                }
-                
-                # Add delay between sections
-                time.sleep(2)
+            # Create more specific search queries (skip reference lists)
+            search_terms = []
+            if section_title.lower() not in ['references', 'bibliography']:
+                search_terms = [
+                    f"{title} {section_title}",
+                    f"{section_title} research methodology"
+                ]
+            
+            section_specs.append((section_key, section_title, section_prompt, search_terms, False, 600))
     
     else:
         st.info("Generating content for standard academic sections...")
         
+        # (section_key, section_title, upper word target, prompt); the references
+        # target assumes 18 APA entries of about 35 words each
         default_sections = [
-            ("introduction", "Introduction", f"""
+            ("introduction", "Introduction", 700, f"""
 Write a comprehensive academic introduction (500-700 words) for this project. Include:
 - Background information and context
 - Problem statement clearly defined
@@ -509,7 +780,7 @@ Write a comprehensive academic introduction (500-700 words) for this project. In
 Use formal academic language with clear paragraph structure.
 """),
             
-            ("literature_review", "Literature Review", f"""
+            ("literature_review", "Literature Review", 800, f"""
 Write a literature review section (600-800 words) for this project. Include:
 - Overview of existing research in the field
 - Key findings from related studies
@@ -520,7 +791,7 @@ Write a literature review section (600-800 words) for this project. Include:
 Structure with clear themes and use academic citation style with placeholder references [1], [2], etc.
 """),
             
-            ("methodology", "Methodology", f"""
+            ("methodology", "Methodology", 600, f"""
 Write a methodology section (500-600 words) for this project. Include:
 - Research design and approach
 - Data collection methods (use bullet points)
@@ -531,7 +802,7 @@ Write a methodology section (500-600 words) for this project. Include:
 Be specific and detailed about the methods with clear structure.
 """),
             
-            ("results", "Results and Analysis", f"""
+            ("results", "Results and Analysis", 500, f"""
 Write a results and expected outcomes section (400-500 words) for this project. Include:
 - Expected findings and results
 - Analysis methods to be used
@@ -542,7 +813,7 @@ Write a results and expected outcomes section (400-500 words) for this project.
 Structure with clear subsections and use appropriate formatting.
 """),
             
-            ("conclusion", "Conclusion", f"""
+            ("conclusion", "Conclusion", 400, f"""
 Write a conclusion section (300-400 words) for this project. Include:
 - Summary of the project objectives
 - Key contributions and significance
@@ -553,7 +824,7 @@ Write a conclusion section (300-400 words) for this project. Include:
 Provide a strong, impactful conclusion that ties everything together.
 """),
             
-            ("references", "References", f"""
+            ("references", "References", 650, f"""
 Generate 12-18 realistic academic references for this project topic. Format them in proper APA style.
 Include a mix of:
 - Recent journal articles (2018-2024)
@@ -565,73 +836,135 @@ Make sure they are relevant to "{title}" and realistic. Use proper APA formattin
 """)
         ]
         
-        for section_key, section_title, prompt_template in default_sections:
-            full_prompt = f"{full_context}\n\n{prompt_template}"
+        # More targeted search queries based on section type
+        search_queries = {
+            'introduction': f"{title} overview concept",
+            'methodology': f"{title} methodology research methods",
+            'literature_review': f"{title} literature research review",
+            'results': f"{title} results analysis data"
+        }
+        
+        for section_key, section_title, max_words, prompt_template in default_sections:
+            # Skip image search for references
+            search_terms = []
+            if section_key != 'references':
+                search_terms = [search_queries.get(section_key, f"{title} {section_title}")]
             
-            with st.spinner(f"Generating {section_title}..."):
-                content = generate_content_with_groq(client, full_prompt)
-                
-                if section_key != 'references':
-                    content = format_content_with_lists(content)
-                
-                # Search for relevant images (skip for references)
-                images = []
-                if (google_api_key and cse_id and section_key != 'references' and 
-                    image_search_count < max_image_searches):
-                    
-                    # More targeted search queries based on section type
-                    if section_key == 'introduction':
-                        search_query = f"{title} overview concept"
-                    elif section_key == 'methodology':
-                        search_query = f"{title} methodology research methods"
-                    elif section_key == 'literature_review':
-                        search_query = f"{title} literature research review"
-                    elif section_key == 'results':
-                        search_query = f"{title} results analysis data"
-                    else:
-                        search_query = f"{title} {section_title}"
-                    
-                    image_results = search_google_images(search_query, google_api_key, cse_id, 3)
-                    image_search_count += 1
-                    
-                    successful_downloads = 0
-                    for img_data in image_results:
-                        if successful_downloads >= 2:
-                            break
-                            
-                        img = download_image_safe(img_data['url'])
-                        if img:
-                            images.append({
-                                'image': img,
-                                'caption': img_data['title'][:80] + "..." if len(img_data['title']) > 80 else img_data['title']
-                            })
-                            successful_downloads += 1
-                
-                sections[section_key] = {
-                    'title': section_title,
-                    'content': content,
-                    'images': images
-                }
+            section_specs.append((section_key, section_title, prompt_template, search_terms,
+                                  section_key == 'references', max_words))
+    
+    # Fallback path: one request per section, bounding in-flight requests for rate limits
+    semaphore = asyncio.Semaphore(5)
+    
+    async def generate_limited(instructions):
+        async with semaphore:
+            return await generate_content_with_groq(client, f"{full_context}\n\n{instructions}")
+    
+    with st.spinner(f"Generating {len(section_specs)} sections..."):
+        # Try all sections in a single request first
+        contents = await generate_sections_batched(client, full_context, section_specs)
+        
+        missing = [spec for spec in section_specs if spec[0] not in contents]
+        if missing:
+            missing_contents = await asyncio.gather(*[generate_limited(spec[2]) for spec in missing])
+            contents.update((spec[0], content) for spec, content in zip(missing, missing_contents))
+    
+    # Cap concurrent image downloads across all sections
+    download_semaphore = asyncio.Semaphore(8)
+    
+    async def download_limited(image_url):
+        async with download_semaphore:
+            return await download_image_safe(image_url)
+    
+    async def fetch_section_images(search_terms):
+        nonlocal image_search_count
+        images = []
+        for search_term in search_terms:
+            # Cached searches don't use any quota; the check and increment happen
+            # without an await in between, so concurrent sections can't overshoot it
+            if cache_lookup(_cse_cache, image_search_cache_key(search_term, cse_id, 3)) is None:
+                if image_search_count >= max_image_searches:
+                    break
+                image_search_count += 1
+            image_results = await search_google_images(search_term, google_api_key, cse_id, 3)
+            
+            # Fetch all candidates at once and keep the first successful ones
+            downloads = await asyncio.gather(
+                *[download_limited(img_data['url']) for img_data in image_results],
+                return_exceptions=True
+            )
+            
+            successful_downloads = 0
+            for img_data, img in zip(image_results, downloads):
+                if successful_downloads >= 2:  # Limit per section
+                    break
                 
-                # Add delay between sections
-                time.sleep(2)
+                if img and not isinstance(img, BaseException):
+                    images.append({
+                        'image': img,
+                        'caption': img_data['title'][:80] + "..." if len(img_data['title']) > 80 else img_data['title']
+                    })
+                    successful_downloads += 1
+            
+            if successful_downloads > 0:
+                break  # Got images, no need to try more queries
+        return images
+    
+    # Search for relevant images for every section at once
+    if google_api_key and cse_id:
+        with st.spinner("Finding images for all sections..."):
+            section_images = await asyncio.gather(
+                *[fetch_section_images(search_terms) for _, _, _, search_terms, _, _ in section_specs]
+            )
+    else:
+        section_images = [[] for _ in section_specs]
+    
+    for (section_key, section_title, _, _, is_references, _), images in zip(section_specs, section_images):
+        content = contents[section_key]
+        if not is_references:
+            content = format_content_with_lists(content)
+        
+        sections[section_key] = {
+            'title': section_title,
+            'content': content,
+            'images': images
+        }
     
     return sections
 
 
-def add_section_content_safe(doc, section_data, section_counter, is_references=False):
-    """Add section content with error handling"""
+def _section_number(section_key):
+    """Sort key placing section_2 before section_10"""
+    suffix = section_key[len('section_'):]
+    return (0, int(suffix)) if suffix.isdigit() else (1, suffix)
+
+
+def _iter_sections(sections):
+    """Yield (section_key, section_data) pairs in document order; custom sections replace the defaults"""
+    custom_keys = sorted((key for key in sections if key.startswith('section_')), key=_section_number)
+    if custom_keys:
+        for key in custom_keys:
+            yield key, sections[key]
+    else:
+        for section_key, _ in DEFAULT_SECTION_ORDER:
+            if section_key in sections:
+                yield section_key, sections[section_key]
+
+
+def add_section_content_safe(leader, section_data, section_counter, is_references=False):
+    """Add section content before the leader paragraph with error handling"""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Inches, Pt
     try:
         # Section heading
         title = section_data.get('display_title', section_data.get('title', 'Section'))
         heading_text = f"{section_counter}. {title}"
         
-        section_heading = doc.add_paragraph(heading_text)
+        section_heading = leader.insert_paragraph_before()
+        section_heading.add_run(heading_text, 'TNR14Bold')
         section_heading.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        if section_heading.runs:
-            section_heading.runs[0].font.name = 'Times New Roman'
-            section_heading.runs[0].font.size = Pt(14)
-            section_heading.runs[0].font.bold = True
+        # Gap from the previous section, instead of an empty paragraph after each section
+        section_heading.paragraph_format.space_before = Pt(12)
         
         # Content
         content = section_data.get('content', '')
@@ -642,12 +975,10 @@ def add_section_content_safe(doc, section_data, section_counter, is_references=F
             for ref_line in ref_lines:
                 ref_line = ref_line.strip()
                 if ref_line and not ref_line.lower().startswith('references'):
-                    para = doc.add_paragraph(ref_line)
+                    para = leader.insert_paragraph_before()
+                    para.add_run(ref_line, 'TNR12')
                     para.paragraph_format.left_indent = Inches(0.5)
                     para.paragraph_format.first_line_indent = Inches(-0.5)
-                    if para.runs:
-                        para.runs[0].font.name = 'Times New Roman'
-                        para.runs[0].font.size = Pt(12)
         else:
             # Handle regular content - split by double newlines for paragraphs
             paragraphs = content.split('\n\n')
@@ -660,64 +991,70 @@ def add_section_content_safe(doc, section_data, section_counter, is_references=F
                 # Check if it's a bullet point
                 if paragraph_text.startswith('•') or paragraph_text.startswith('-'):
                     # Add as bullet point
-                    bullet_para = doc.add_paragraph()
-                    bullet_para.style = 'List Bullet'
+                    bullet_para = leader.insert_paragraph_before(style='List Bullet')
                     bullet_text = paragraph_text.lstrip('•-').strip()
-                    bullet_run = bullet_para.add_run(bullet_text)
-                    bullet_run.font.name = 'Times New Roman'
-                    bullet_run.font.size = Pt(12)
+                    bullet_para.add_run(bullet_text, 'TNR12')
                 else:
                     # Add as regular paragraph
-                    para = doc.add_paragraph(paragraph_text)
+                    para = leader.insert_paragraph_before()
+                    para.add_run(paragraph_text, 'TNR12')
                     para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-                    if para.runs:
-                        para.runs[0].font.name = 'Times New Roman'
-                        para.runs[0].font.size = Pt(12)
         
         # Add images if available
-        if 'images' in section_data and section_data['images']:
-            for img_data in section_data['images'][:2]:  # Limit to 2 images
+        if images := section_data.get('images'):
+            for img_data in images[:2]:  # Limit to 2 images
                 try:
-                    success = add_image_to_document_safe(doc, img_data['image'], img_data.get('caption', ''), 4.5)
-                    if success:
-                        # Add some spacing after image
-                        doc.add_paragraph()
+                    # Spacing after each image is set on its last paragraph
+                    add_image_to_document_safe(leader, img_data['image'], img_data.get('caption', ''), 4.5)
                 except Exception:
                     pass  # Continue if image fails
         
-        # Add spacing
-        doc.add_paragraph()
-        
     except Exception as e:
         st.warning(f"Section content error: {str(e)}")
 
 
+@st.cache_resource
+def _base_document_bytes():
+    """Return a saved blank document with the margins and styles every project uses"""
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Inches, Pt
+    doc = Document()
+    
+    # Set document margins for safety
+    section = doc.sections[0]
+    section.top_margin = Inches(1)
+    section.bottom_margin = Inches(1)
+    section.left_margin = Inches(1)
+    section.right_margin = Inches(1)
+    
+    # Configure default style safely
+    try:
+        normal_style = doc.styles['Normal']
+        normal_style.font.name = 'Times New Roman'
+        normal_style.font.size = Pt(12)
+        normal_style.paragraph_format.line_spacing = 1.15
+        normal_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+    except:
+        pass
+    
+    # Create safe heading and run styles
+    create_heading_style(doc, 'SafeHeading1', 16, True)
+    create_run_styles(doc)
+    
+    base_io = io.BytesIO()
+    doc.save(base_io)
+    return base_io.getvalue()
+
+
 def create_word_document_safe(title, student_name, description, toc_items, num_pages, 
                              sections, pdf_files, client, google_api_key=None, cse_id=None):
     """Create Word document with improved error handling"""
+    from docx import Document
+    from docx.enum.text import WD_BREAK
     try:
-        # Create new document
-        doc = Document()
-        
-        # Set document margins for safety
-        section = doc.sections[0]
-        section.top_margin = Inches(1)
-        section.bottom_margin = Inches(1)
-        section.left_margin = Inches(1)
-        section.right_margin = Inches(1)
-        
-        # Configure default style safely
-        try:
-            normal_style = doc.styles['Normal']
-            normal_style.font.name = 'Times New Roman'
-            normal_style.font.size = Pt(12)
-            normal_style.paragraph_format.line_spacing = 1.15
-            normal_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-        except:
-            pass
-        
-        # Create safe heading styles
-        heading1_style = create_heading_style(doc, 'SafeHeading1', 16, True)
+        # Create new document from the pre-styled base
+        doc = Document(io.BytesIO(_base_document_bytes()))
         
         # Add headers and footers safely
         try:
@@ -725,129 +1062,72 @@ def create_word_document_safe(title, student_name, description, toc_items, num_p
         except Exception as e:
             st.warning(f"Header/footer creation failed: {str(e)}")
         
+        # Body content is inserted before this trailing paragraph, which is O(1)
+        # per paragraph, unlike doc.add_paragraph() which scans the body each call
+        leader = doc.add_paragraph()
+        
         # === COVER PAGE ===
         try:
-            # Title
-            title_para = doc.add_paragraph()
-            title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            title_run = title_para.add_run(title.upper())
-            title_run.font.name = 'Times New Roman'
-            title_run.font.size = Pt(18)
-            title_run.font.bold = True
-            
-            # Add spacing
-            for _ in range(3):
-                doc.add_paragraph()
-            
-            # Subtitle
-            subtitle_para = doc.add_paragraph()
-            subtitle_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            subtitle_run = subtitle_para.add_run("A Comprehensive Academic Project")
-            subtitle_run.font.name = 'Times New Roman'
-            subtitle_run.font.size = Pt(14)
-            subtitle_run.font.italic = True
-            
-            # Add spacing
-            for _ in range(2):
-                doc.add_paragraph()
+            # Title, then subtitle, each followed by spacing in place of blank lines
+            styled_para(leader, title.upper(), size=18, bold=True, space_after=36)
+            styled_para(leader, "A Comprehensive Academic Project", size=14, italic=True, space_after=24)
             
             # Student name
-            name_para = doc.add_paragraph()
-            name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            name_run = name_para.add_run(f"Submitted by:\n{student_name}")
-            name_run.font.name = 'Times New Roman'
-            name_run.font.size = Pt(14)
-            name_run.font.bold = True
+            styled_para(leader, f"Submitted by:\n{student_name}", size=14, bold=True, space_after=12)
             
             # Date
-            doc.add_paragraph()
-            date_para = doc.add_paragraph()
-            date_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            current_date = datetime.now().strftime("%B %d, %Y")
-            date_run = date_para.add_run(current_date)
-            date_run.font.name = 'Times New Roman'
-            date_run.font.size = Pt(12)
+            styled_para(leader, _today_str(date.today().toordinal()), size=12)
             
         except Exception as e:
             st.warning(f"Cover page creation error: {str(e)}")
         
         # Page break
-        doc.add_page_break()
+        leader.insert_paragraph_before().add_run().add_break(WD_BREAK.PAGE)
         
         # === ABSTRACT ===
         try:
-            abstract_heading = doc.add_paragraph("ABSTRACT")
-            abstract_heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            abstract_run = abstract_heading.runs[0]
-            abstract_run.font.name = 'Times New Roman'
-            abstract_run.font.size = Pt(14)
-            abstract_run.font.bold = True
+            styled_para(leader, "ABSTRACT", size=14, bold=True)
             
-            # Generate and add abstract
-            formal_abstract = generate_formal_abstract(client, title, description, num_pages)
-            abstract_para = doc.add_paragraph(formal_abstract)
-            abstract_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-            for run in abstract_para.runs:
-                run.font.name = 'Times New Roman'
-                run.font.size = Pt(12)
+            # Generate and add abstract, one justified paragraph per blank-line-separated block
+            formal_abstract = run_async(generate_formal_abstract(client, title, description, num_pages))
+            for abstract_text in formal_abstract.split('\n\n'):
+                abstract_text = abstract_text.strip()
+                if abstract_text:
+                    styled_para(leader, abstract_text, size=12, align='justify')
                 
         except Exception as e:
             st.warning(f"Abstract creation error: {str(e)}")
         
-        doc.add_page_break()
+        leader.insert_paragraph_before().add_run().add_break(WD_BREAK.PAGE)
         
         # === TABLE OF CONTENTS ===
         try:
-            toc_heading = doc.add_paragraph("TABLE OF CONTENTS")
-            toc_heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            toc_run = toc_heading.runs[0]
-            toc_run.font.name = 'Times New Roman'
-            toc_run.font.size = Pt(14)
-            toc_run.font.bold = True
+            styled_para(leader, "TABLE OF CONTENTS", size=14, bold=True)
             
             # Add simple TOC placeholder
-            toc_para = doc.add_paragraph("Table of contents will be generated automatically when opened in Microsoft Word.")
-            toc_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            toc_para_run = toc_para.runs[0]
-            toc_para_run.font.italic = True
-            toc_para_run.font.size = Pt(11)
+            styled_para(leader, "Table of contents will be generated automatically when opened in Microsoft Word.",
+                        size=11, italic=True)
             
         except Exception as e:
             st.warning(f"TOC creation error: {str(e)}")
         
-        doc.add_page_break()
+        leader.insert_paragraph_before().add_run().add_break(WD_BREAK.PAGE)
         
         # === MAIN CONTENT SECTIONS ===
-        section_counter = 1
-        
         try:
-            if any(key.startswith('section_') for key in sections.keys()):
-                # Custom sections
-                for key in sorted(sections.keys()):
-                    if key.startswith('section_'):
-                        add_section_content_safe(doc, sections[key], section_counter)
-                        section_counter += 1
-            else:
-                # Default sections
-                default_section_order = [
-                    ('introduction', 'INTRODUCTION'),
-                    ('literature_review', 'LITERATURE REVIEW'), 
-                    ('methodology', 'METHODOLOGY'),
-                    ('results', 'RESULTS AND ANALYSIS'),
-                    ('conclusion', 'CONCLUSION'),
-                    ('references', 'REFERENCES')
-                ]
-                
-                for section_key, section_title in default_section_order:
-                    if section_key in sections:
-                        section_data = sections[section_key]
-                        section_data['display_title'] = section_title
-                        add_section_content_safe(doc, section_data, section_counter, is_references=(section_key=='references'))
-                        section_counter += 1
+            for section_counter, (section_key, section_data) in enumerate(_iter_sections(sections), start=1):
+                # Default sections get their standard headings; custom sections keep their titles.
+                # The heading goes on a copy so the caller's sections (reused by the preview) are untouched
+                if section_key in _DEFAULT_DISPLAY_TITLES:
+                    section_data = {**section_data, 'display_title': _DEFAULT_DISPLAY_TITLES[section_key]}
+                add_section_content_safe(leader, section_data, section_counter, is_references=(section_key=='references'))
                         
         except Exception as e:
             st.error(f"Content section creation error: {str(e)}")
         
+        # Drop the now-empty leader paragraph
+        leader._element.getparent().remove(leader._element)
+        
         return doc
         
     except Exception as e:
@@ -858,27 +1138,30 @@ def create_word_document_safe(title, student_name, description, toc_items, num_p
 
 def create_minimal_document(title, student_name, description):
     """Create a minimal document if main creation fails"""
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt
     try:
         doc = Document()
+        create_run_styles(doc)
+        leader = doc.add_paragraph()
         
         # Title
-        title_para = doc.add_paragraph(title)
+        title_para = leader.insert_paragraph_before()
+        title_para.add_run(title, 'TNR16Bold')
         title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        title_para.runs[0].font.bold = True
-        title_para.runs[0].font.size = Pt(16)
-        
-        doc.add_paragraph()
+        title_para.paragraph_format.space_after = Pt(12)
         
         # Student name
-        name_para = doc.add_paragraph(f"By: {student_name}")
+        name_para = leader.insert_paragraph_before(f"By: {student_name}")
         name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        doc.add_paragraph()
+        name_para.paragraph_format.space_after = Pt(12)
         
         # Description
-        desc_para = doc.add_paragraph(description)
+        desc_para = leader.insert_paragraph_before(description)
         desc_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
         
+        leader._element.getparent().remove(leader._element)
         return doc
     except:
         # Final fallback
@@ -890,42 +1173,15 @@ def create_minimal_document(title, student_name, description):
 def display_content_preview(sections):
     """Display preview of generated content with proper formatting"""
     with st.expander("Preview Generated Content"):
-        if any(key.startswith('section_') for key in sections.keys()):
-            for key in sorted(sections.keys()):
-                if key.startswith('section_'):
-                    section_data = sections[key]
-                    st.subheader(f"{section_data['title']}")
-                    content = section_data['content']
-                    preview_content = content[:400] + "..." if len(content) > 400 else content
-                    st.write(preview_content)
-                    
-                    if 'images' in section_data and section_data['images']:
-                        st.write(f"📷 {len(section_data['images'])} image(s) will be included")
-                    st.markdown("---")
-        else:
-            section_titles = {
-                'introduction': 'Introduction',
-                'literature_review': 'Literature Review',
-                'methodology': 'Methodology',
-                'results': 'Results and Analysis',
-                'conclusion': 'Conclusion',
-                'references': 'References'
-            }
-            
-            section_order = ['introduction', 'literature_review', 'methodology',
-                           'results', 'conclusion', 'references']
+        for section_key, section_data in _iter_sections(sections):
+            st.subheader(SECTION_TITLES.get(section_key, section_data['title']))
+            content = section_data['content']
+            preview_content = content if len(content) <= 400 else f"{content[:400]}…"
+            st.write(preview_content)
             
-            for section_key in section_order:
-                if section_key in sections:
-                    section_data = sections[section_key]
-                    st.subheader(section_titles.get(section_key, section_key.title()))
-                    content = section_data['content']
-                    preview_content = content[:400] + "..." if len(content) > 400 else content
-                    st.write(preview_content)
-                    
-                    if 'images' in section_data and section_data['images']:
-                        st.write(f"📷 {len(section_data['images'])} image(s) will be included")
-                    st.markdown("---")
+            if images := section_data.get('images'):
+                st.write(f"📷 {len(images)} image(s) will be included")
+            st.markdown("---")
 
 
 def main():
@@ -972,245 +1228,255 @@ def main():
         st.info("Get your free API key from [Groq Console](https://console.groq.com/)")
         return
     
-    # Initialize Groq client
-    try:
-        client = Groq(api_key=groq_api_key)
-    except Exception as e:
-        st.error(f"Error initializing Groq client: {str(e)}")
-        return
-    
-    # Main interface layout
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        st.header("📝 Project Information")
-        
-        title = st.text_input(
-            "Project Title *",
-            placeholder="e.g., Machine Learning Applications in Healthcare",
-            help="Enter a descriptive title for your project"
-        )
-        
-        student_name = st.text_input(
-            "Student Name *",
-            placeholder="Enter your full name"
-        )
-        
-        description = st.text_area(
-            "Project Description *",
-            placeholder="Provide a detailed description of your project, including objectives, methodology, and expected outcomes...",
-            height=150,
-            help="This will be used to generate a formal abstract and relevant content"
-        )
+    # Main interface layout; inputs are only submitted (and the script rerun)
+    # when the form is submitted, not on every keystroke
+    with st.form("project_form"):
+        col1, col2 = st.columns([2, 1])
         
-        toc_items = st.text_area(
-            "Custom Table of Contents (Optional)",
-            placeholder="Introduction\nLiterature Review\nMethodology\nResults and Analysis\nConclusion",
-            height=100,
-            help="Leave empty to use default academic structure"
-        )
+        with col1:
+            st.header("📝 Project Information")
+            
+            title = st.text_input(
+                "Project Title *",
+                placeholder="e.g., Machine Learning Applications in Healthcare",
+                help="Enter a descriptive title for your project"
+            )
+            
+            student_name = st.text_input(
+                "Student Name *",
+                placeholder="Enter your full name"
+            )
+            
+            description = st.text_area(
+                "Project Description *",
+                placeholder="Provide a detailed description of your project, including objectives, methodology, and expected outcomes...",
+                height=150,
+                help="This will be used to generate a formal abstract and relevant content"
+            )
+            
+            toc_items = st.text_area(
+                "Custom Table of Contents (Optional)",
+                placeholder="Introduction\nLiterature Review\nMethodology\nResults and Analysis\nConclusion",
+                height=100,
+                help="Leave empty to use default academic structure"
+            )
+            
+            num_pages = st.slider(
+                "Target Number of Pages",
+                min_value=5,
+                max_value=50,
+                value=15,
+                help="This affects the depth of generated content"
+            )
         
-        num_pages = st.slider(
-            "Target Number of Pages",
-            min_value=5,
-            max_value=50,
-            value=15,
-            help="This affects the depth of generated content"
-        )
+        with col2:
+            st.header("📚 Additional Resources")
+            
+            pdf_files = st.file_uploader(
+                "Upload Reference PDFs (Optional)",
+                type=['pdf'],
+                accept_multiple_files=True,
+                help="Upload PDFs to extract context for better content generation"
+            )
+            
+            if pdf_files:
+                st.success(f"📄 {len(pdf_files)} PDF(s) uploaded")
+            
+            additional_notes = st.text_area(
+                "Additional Notes/Requirements",
+                placeholder="Any specific requirements, focus areas, or additional context...",
+                height=100
+            )
+            
+            st.markdown("---")
+            st.header("🚀 Generate Project")
+            
+            # Input validation
+            can_generate = all([title, student_name, description, groq_api_key])
+            
+            if not can_generate:
+                missing = []
+                if not title:
+                    missing.append("Project Title")
+                if not student_name:
+                    missing.append("Student Name")
+                if not description:
+                    missing.append("Project Description")
+                
+                for item in missing:
+                    st.warning(f"❌ Missing: {item}")
+            
+            # Feature indicators
+            features = []
+            features.append("✅ AI-Generated Content")
+            features.append("✅ Professional Word Formatting")
+            features.append("✅ Headers & Footers")
+            features.append("✅ Proper Citations & References")
+            features.append("✅ Table of Contents")
+            
+            if google_api_key and cse_id:
+                features.append("✅ Automatic Image Integration")
+            else:
+                features.append("⚪ Image Integration (API keys needed)")
+            
+            st.markdown("### Features:")
+            for feature in features:
+                st.markdown(feature)
+            
+            # Generate button
+            submitted = st.form_submit_button(
+                "🎯 Generate Complete Project",
+                type="primary",
+                use_container_width=True,
+                help="Generate a complete academic project with AI-powered content and images"
+            )
     
-    with col2:
-        st.header("📚 Additional Resources")
-        
-        pdf_files = st.file_uploader(
-            "Upload Reference PDFs (Optional)",
-            type=['pdf'],
-            accept_multiple_files=True,
-            help="Upload PDFs to extract context for better content generation"
-        )
-        
-        if pdf_files:
-            st.success(f"📄 {len(pdf_files)} PDF(s) uploaded")
-        
-        additional_notes = st.text_area(
-            "Additional Notes/Requirements",
-            placeholder="Any specific requirements, focus areas, or additional context...",
-            height=100
-        )
-        
-        st.markdown("---")
-        st.header("🚀 Generate Project")
+    # Generation output is rendered below the form; download buttons cannot live inside one
+    if submitted and can_generate:
+        # Initialize Groq client only when generating, so UI-only reruns never import groq
+        try:
+            client = get_groq_client(groq_api_key)
+        except Exception as e:
+            st.error(f"Error initializing Groq client: {str(e)}")
+            return
         
-        # Input validation
-        can_generate = all([title, student_name, description, groq_api_key])
+        # Show progress
+        progress_bar = st.progress(0)
+        status_text = st.empty()
         
-        if not can_generate:
-            missing = []
-            if not title:
-                missing.append("Project Title")
-            if not student_name:
-                missing.append("Student Name")
-            if not description:
-                missing.append("Project Description")
-            
-            for item in missing:
-                st.warning(f"❌ Missing: {item}")
-        
-        # Feature indicators
-        features = []
-        features.append("✅ AI-Generated Content")
-        features.append("✅ Professional Word Formatting")
-        features.append("✅ Headers & Footers")
-        features.append("✅ Proper Citations & References")
-        features.append("✅ Table of Contents")
-        
-        if google_api_key and cse_id:
-            features.append("✅ Automatic Image Integration")
-        else:
-            features.append("⚪ Image Integration (API keys needed)")
-        
-        st.markdown("### Features:")
-        for feature in features:
-            st.markdown(feature)
-        
-        # Generate button
-        if st.button(
-            "🎯 Generate Complete Project",
-            disabled=not can_generate,
-            type="primary",
-            use_container_width=True,
-            help="Generate a complete academic project with AI-powered content and images"
-        ):
-            if can_generate:
-                # Show progress
-                progress_bar = st.progress(0)
-                status_text = st.empty()
+        try:
+            # Extract PDF texts
+            pdf_texts = []
+            if pdf_files:
+                status_text.text("📄 Processing uploaded PDFs...")
+                progress_bar.progress(10)
                 
-                try:
-                    # Extract PDF texts
-                    pdf_texts = []
-                    if pdf_files:
-                        status_text.text("📄 Processing uploaded PDFs...")
-                        progress_bar.progress(10)
-                        
-                        for pdf_file in pdf_files:
-                            pdf_text = extract_pdf_text(pdf_file)
-                            if not pdf_text.startswith("Error"):
-                                pdf_texts.append(pdf_text)
-                        
-                        if pdf_texts:
-                            st.success(f"✅ Successfully processed {len(pdf_texts)} PDFs")
-                        else:
-                            st.warning("⚠️ No readable content found in uploaded PDFs")
-                    
-                    progress_bar.progress(20)
-                    
-                    # Generate content
-                    status_text.text("🤖 AI is generating your project content...")
-                    
-                    sections = generate_project_sections(
-                        client, title, description, toc_items,
-                        num_pages, pdf_texts, additional_notes,
-                        google_api_key, cse_id
-                    )
-                    
-                    progress_bar.progress(70)
-                    
-                    # Create Word document using the safe function
-                    status_text.text("📝 Creating Word document with formatting...")
-                    
-                    doc = create_word_document_safe(
-                        title, student_name, description, toc_items,
-                        num_pages, sections, pdf_files, client,
-                        google_api_key, cse_id
+                # Extraction is serialized by _PDFIUM_LOCK anyway; tick the bar per file
+                for done, pdf_file in enumerate(pdf_files, start=1):
+                    pdf_text = cached_pdf_text(
+                        pdf_file.name, pdf_file.size,
+                        hashlib.sha1(pdf_file.getvalue()).hexdigest(), pdf_file
                     )
-                    
-                    progress_bar.progress(90)
-                    
-                    # Save to BytesIO
-                    doc_io = io.BytesIO()
-                    doc.save(doc_io)
-                    doc_io.seek(0)
-                    
-                    # Create safe filename
-                    safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                    safe_title = safe_title.replace(' ', '_')[:30]
-                    filename = f"{safe_title}_Enhanced_Project.docx" if safe_title else "AI_Generated_Enhanced_Project.docx"
-                    
-                    progress_bar.progress(100)
-                    status_text.text("✅ Project generation complete!")
-                    
-                    st.success("🎉 Complete project generated successfully!")
-                    st.balloons()
-                    
-                    # Show statistics
-                    col_stat1, col_stat2, col_stat3 = st.columns(3)
-                    
-                    with col_stat1:
-                        st.metric("📊 Sections Generated", len(sections))
-                    
-                    with col_stat2:
-                        total_images = sum(len(section.get('images', [])) for section in sections.values())
-                        st.metric("🖼️ Images Added", total_images)
-                    
-                    with col_stat3:
-                        total_words = sum(len(section['content'].split()) for section in sections.values())
-                        st.metric("📝 Total Words", f"{total_words:,}")
-                    
-                    # Download button
-                    st.download_button(
-                        label="📥 Download Enhanced Project",
-                        data=doc_io.getvalue(),
-                        file_name=filename,
-                        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                        type="primary",
-                        use_container_width=True
-                    )
-                    
-                    # Show preview
-                    display_content_preview(sections)
-                    
-                    # Instructions for users
-                    with st.expander("📋 Document Instructions"):
-                        st.markdown("""
-                        ### Your Enhanced Document Includes:
-                        
-                        **Professional Formatting:**
-                        - ✅ Cover page with title, name, and date
-                        - ✅ Headers with project title
-                        - ✅ Footers with your name and page numbers
-                        - ✅ Proper font styling (Times New Roman, 12pt)
-                        - ✅ 1.5 line spacing and justified text
-                        
-                        **Content Structure:**
-                        - ✅ Formal abstract (150-200 words)
-                        - ✅ Automatic table of contents
-                        - ✅ Well-structured sections with headings
-                        - ✅ Bullet points and numbered lists where appropriate
-                        - ✅ APA-style references with hanging indent
-                        
-                        **Visual Elements:**
-                        - ✅ Relevant images with captions (if API keys provided)
-                        - ✅ Proper image alignment and sizing
-                        
-                        ### Next Steps:
-                        1. **Open the document** in Microsoft Word
-                        2. **Update the Table of Contents:** Right-click on TOC → Update Field → Update entire table
-                        3. **Review and customize** the content as needed
-                        4. **Check citations** and add real references if required
-                        5. **Proofread** for any final adjustments
-                        
-                        ### Tips:
-                        - The document uses heading styles for easy navigation
-                        - All formatting is consistent and professional
-                        - Images are automatically sized and centered
-                        - References follow APA format guidelines
-                        """)
-                    
-                except Exception as e:
-                    progress_bar.progress(0)
-                    status_text.text("")
-                    st.error(f"❌ Error generating project: {str(e)}")
-                    st.info("💡 Please check your API keys and try again")
+                    if not pdf_text.startswith("Error"):
+                        pdf_texts.append(pdf_text)
+                    progress_bar.progress(10 + 10 * done // len(pdf_files))
+                
+                if pdf_texts:
+                    st.success(f"✅ Successfully processed {len(pdf_texts)} PDFs")
+                else:
+                    st.warning("⚠️ No readable content found in uploaded PDFs")
+            
+            progress_bar.progress(20)
+            
+            # Generate content
+            status_text.text("🤖 AI is generating your project content...")
+            
+            sections = run_async(generate_project_sections(
+                client, title, description, toc_items,
+                num_pages, pdf_texts, additional_notes,
+                google_api_key, cse_id
+            ))
+            
+            progress_bar.progress(70)
+            
+            # Create Word document using the safe function
+            status_text.text("📝 Creating Word document with formatting...")
+            
+            doc = create_word_document_safe(
+                title, student_name, description, toc_items,
+                num_pages, sections, pdf_files, client,
+                google_api_key, cse_id
+            )
+            
+            progress_bar.progress(90)
+            
+            # Save to BytesIO; the download button reads the buffer itself
+            doc_io = io.BytesIO()
+            doc.save(doc_io)
+            
+            # Create safe filename
+            if title.isascii():
+                safe_title = title.translate(_FILENAME_DROP_TABLE).rstrip()
+            else:
+                safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            safe_title = safe_title.replace(' ', '_')[:30]
+            filename = f"{safe_title}_Enhanced_Project.docx" if safe_title else "AI_Generated_Enhanced_Project.docx"
+            
+            progress_bar.progress(100)
+            status_text.text("✅ Project generation complete!")
+            
+            st.success("🎉 Complete project generated successfully!")
+            st.balloons()
+            
+            # Show statistics
+            col_stat1, col_stat2, col_stat3 = st.columns(3)
+            
+            with col_stat1:
+                st.metric("📊 Sections Generated", len(sections))
+            
+            with col_stat2:
+                total_images = sum(len(section.get('images', [])) for section in sections.values())
+                st.metric("🖼️ Images Added", total_images)
+            
+            with col_stat3:
+                total_words = sum(len(section['content'].split()) for section in sections.values())
+                st.metric("📝 Total Words", f"{total_words:,}")
+            
+            # Download button
+            st.download_button(
+                label="📥 Download Enhanced Project",
+                data=doc_io,
+                file_name=filename,
+                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                type="primary",
+                use_container_width=True
+            )
+            
+            # Show preview
+            display_content_preview(sections)
+            
+            # Instructions for users
+            with st.expander("📋 Document Instructions"):
+                st.markdown("""
+                ### Your Enhanced Document Includes:
+                
+                **Professional Formatting:**
+                - ✅ Cover page with title, name, and date
+                - ✅ Headers with project title
+                - ✅ Footers with your name and page numbers
+                - ✅ Proper font styling (Times New Roman, 12pt)
+                - ✅ 1.5 line spacing and justified text
+                
+                **Content Structure:**
+                - ✅ Formal abstract (150-200 words)
+                - ✅ Automatic table of contents
+                - ✅ Well-structured sections with headings
+                - ✅ Bullet points and numbered lists where appropriate
+                - ✅ APA-style references with hanging indent
+                
+                **Visual Elements:**
+                - ✅ Relevant images with captions (if API keys provided)
+                - ✅ Proper image alignment and sizing
+                
+                ### Next Steps:
+                1. **Open the document** in Microsoft Word
+                2. **Update the Table of Contents:** Right-click on TOC → Update Field → Update entire table
+                3. **Review and customize** the content as needed
+                4. **Check citations** and add real references if required
+                5. **Proofread** for any final adjustments
+                
+                ### Tips:
+                - The document uses heading styles for easy navigation
+                - All formatting is consistent and professional
+                - Images are automatically sized and centered
+                - References follow APA format guidelines
+                """)
+            
+        except Exception as e:
+            progress_bar.progress(0)
+            status_text.text("")
+            st.error(f"❌ Error generating project: {str(e)}")
+            st.info("💡 Please check your API keys and try again")
     
     # Information sections
     st.markdown("---")